@@ -4,9 +4,11 @@ Oracle to SQL Server SQL Converter
 
 This script converts Oracle SQL DDL and DML statements to SQL Server format.
 It processes the entire input sql file and outputs to an output sql file with 
-the same name but with the extension _sqlserver_definitions.sql and _sqlserver_inserts_all.sql.
-The _sqlserver_inserts_all.sql file is then split into 100,000 line chunks and output to
-files with the extension _sqlserver_inserts_chunk_01.sql, _sqlserver_inserts_chunk_02.sql, etc.
+the same name but with the extension _sqlserver_definitions.sql. The INSERT statements
+are written directly in 100,000 line chunks to files with the extension
+_sqlserver_inserts_chunk_01.sql, _sqlserver_inserts_chunk_02.sql, etc.
+With --emit-bulk, INSERT rows are instead written to a CSV data file per table
+(_sqlserver_bulk_<table>.csv), loaded by BULK INSERT statements in the definitions file.
 
 The input sql file is expected to be in the Oracle format and can be created by a DDL export from SQL Developer.
 The output sql file is expected to be in the SQL Server format and can be executed in SQL Server Management Studio 
@@ -16,7 +18,7 @@ The script is designed to be used as a command line tool and can be run from the
 
 The script will automatically:
 - Separate table definitions from INSERT statements
-- Split large INSERT files into 100,000 line chunks
+- Write INSERT statements in 100,000 line chunks
 - Convert Oracle data types to SQL Server equivalents
 - Handle Oracle-specific functions and syntax
 
@@ -30,9 +32,419 @@ http://www.landis.org.uk
 
 import re
 import os
+import queue
 import argparse
+import threading
+import multiprocessing
+from collections import deque
 from datetime import datetime
 
+# One comma-terminated INSERT value: unquoted text and '...' or "..." quoted sections
+# (doubled quotes stay inside the section, an unterminated quote runs to the end).
+# Written as unrolled loops so that no text can be matched in more than one way,
+# which keeps the regex engine from backtracking through long values.
+# Shared by OracleToSQLServerConverter.escape_quotes_in_values and BulkDataWriter.
+_RE_VALUE_FIELD = re.compile(
+    r"""([^,'"]*(?:(?:'[^']*(?:''[^']*)*'?|"[^"]*(?:""[^"]*)*"?)[^,'"]*)*),"""
+)
+
+
+class ChunkWriter:
+    """
+    Writes INSERT statements to a series of numbered chunk files.
+    
+    A new chunk file is started once the current one holds the configured
+    number of lines, so the INSERT statements never have to be written to
+    a single file and split afterwards. A statement is never split across
+    two chunk files.
+    """
+    
+    def __init__(self, chunk_prefix, header='', lines_per_chunk=100000, all_file=None):
+        """
+        Initialize the chunk writer.
+        
+        Args:
+            chunk_prefix (str): Path prefix for the chunk files; the chunk number and .sql are appended
+            header (str): Text written at the start of every chunk file
+            lines_per_chunk (int): Number of lines after which a new chunk file is started
+            all_file (str, optional): Path of a single file that also receives every statement
+        """
+        self.chunk_prefix = chunk_prefix
+        self.header = header
+        self.lines_per_chunk = lines_per_chunk
+        self.chunk_files = []
+        self.chunk_index = 0
+        self.line_count = 0
+        self.current_fh = None
+        self.all_fh = None
+        if all_file is not None:
+            self.all_fh = open(all_file, 'w', encoding='utf-8')
+            self.all_fh.write(header)
+    
+    def _open_next_chunk(self):
+        """Close the current chunk file and open the next one."""
+        if self.current_fh is not None:
+            self.current_fh.close()
+        self.chunk_index += 1
+        chunk_file = f"{self.chunk_prefix}{self.chunk_index:02d}.sql"
+        # TextIOWrapper already gathers small writes before encoding them; larger
+        # buffers or joining statements before writing measured no faster
+        self.current_fh = open(chunk_file, 'w', encoding='utf-8')
+        self.current_fh.write(self.header)
+        self.chunk_files.append(chunk_file)
+        self.line_count = self.header.count('\n')
+    
+    def write(self, text):
+        """
+        Write a statement to the current chunk file.
+        
+        Args:
+            text (str): Statement text, including its trailing newline
+        """
+        if self.current_fh is None or self.line_count >= self.lines_per_chunk:
+            self._open_next_chunk()
+        self.current_fh.write(text)
+        self.line_count += text.count('\n')
+        if self.all_fh is not None:
+            self.all_fh.write(text)
+    
+    def flush(self):
+        """Flush the open output files."""
+        for fh in (self.current_fh, self.all_fh):
+            if fh is not None:
+                fh.flush()
+    
+    def close(self):
+        """Close the open output files."""
+        for fh in (self.current_fh, self.all_fh):
+            if fh is not None:
+                fh.close()
+        self.current_fh = None
+        self.all_fh = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MultiRowInsertWriter:
+    """
+    Combines consecutive INSERT statements into multi-row INSERT statements.
+    
+    Consecutive converted INSERTs into the same table with the same column
+    list are written as a single INSERT ... VALUES statement with one row
+    constructor per statement, which SQL Server parses and loads much faster
+    than separate statements. Any other text (e.g. commented-out lines) is
+    written after the pending rows, so the statement order is kept.
+    
+    SQL Server derives the type of each column from all rows of the VALUES
+    clause together (by type precedence, and the largest precision and scale
+    for decimals), so rows that load one at a time can fail or be rounded
+    differently once combined.
+    """
+    
+    # SQL Server accepts at most 1000 row constructors in one VALUES clause
+    MAX_ROWS_PER_INSERT = 1000
+    
+    def __init__(self, outfile, rows_per_insert=MAX_ROWS_PER_INSERT):
+        """
+        Initialize the multi-row INSERT writer.
+        
+        Args:
+            outfile (ChunkWriter): Writer the combined statements are written to
+            rows_per_insert (int): Maximum number of rows in one INSERT statement
+        """
+        self.outfile = outfile
+        self.rows_per_insert = rows_per_insert
+        self.insert_header = None
+        self.rows = []
+    
+    def write(self, text):
+        """
+        Add a converted INSERT statement, or write any other text through.
+        
+        Args:
+            text (str): Statement text, including its trailing newline
+        """
+        values_at = text.find(') VALUES (') + 8
+        row = text[values_at + 1:].rstrip()
+        if values_at < 8 or not text.startswith('INSERT INTO ') or not row.endswith(')'):
+            self.flush()
+            self.outfile.write(text)
+            return
+        
+        insert_header = text[:values_at]
+        if insert_header != self.insert_header or len(self.rows) == self.rows_per_insert:
+            self.flush()
+            self.insert_header = insert_header
+        self.rows.append(row)
+    
+    def flush(self):
+        """Write the pending rows as one INSERT statement."""
+        if self.rows:
+            self.outfile.write(self.insert_header + '\n' + ',\n'.join(self.rows) + '\n\n')
+            self.rows = []
+        self.outfile.flush()
+
+
+class BulkDataWriter:
+    """
+    Writes INSERT rows to CSV data files for SQL Server BULK INSERT.
+    
+    A converted INSERT statement whose values are all literals becomes one
+    CSV row in a data file per table, which BULK INSERT loads much faster
+    than SQL Server executes the equivalent INSERT statements. Statements
+    that cannot be represented as a row of the table (e.g. a function call
+    as a value, a column list that differs from the table definition, or a
+    table with no definition before its INSERTs) are passed to the fallback
+    writer unchanged.
+    """
+    
+    _RE_INSERT_HEADER = re.compile(r'INSERT INTO \[([^\]]*)\]\.\[([^\]]+)\] \(\[(.*)\]\) VALUES')
+    # No exponent: BULK INSERT rejects it for integer and decimal columns, so such rows stay INSERTs
+    _RE_NUMBER_LITERAL = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)')
+    _RE_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+    _RE_FILE_NAME_UNSAFE = re.compile(r'[^A-Za-z0-9_.-]')
+    
+    def __init__(self, data_prefix, fallback_writer, table_info):
+        """
+        Initialize the bulk data writer.
+        
+        Args:
+            data_prefix (str): Path prefix for the data files; the table name and .csv are appended
+            fallback_writer (ChunkWriter or MultiRowInsertWriter): Writer for statements
+                that are not written as data rows
+            table_info (dict): Converted table definitions, keyed by table name
+        """
+        self.data_prefix = data_prefix
+        self.fallback_writer = fallback_writer
+        self.table_info = table_info
+        self.data_files = {}  # Table name -> (schema name, data file path)
+        self.row_counts = {}
+        self._used_file_names = set()  # Lower-cased, as file names may be case-insensitive
+        self._header_tables = {}  # INSERT header -> (table name, column count), or None
+        self._current_table = None
+        self._current_fh = None
+    
+    def _table_for_header(self, insert_header):
+        """
+        Return the table and column count for an INSERT header, or None if its rows cannot be bulk loaded.
+        
+        Rows are loaded by position, so a table's data file only takes rows with
+        the column list of its first INSERT, and only if that list matches the
+        column order of a table definition read earlier in the input.
+        """
+        header_match = self._RE_INSERT_HEADER.fullmatch(insert_header)
+        if not header_match:
+            return None
+        schema_name, table_name, columns = header_match.groups()
+        column_names = columns.split('], [')
+        
+        if table_name in self.data_files:
+            return None
+        definition = self.table_info.get(table_name)
+        if definition is None or definition.get('column_names') != column_names:
+            return None
+        
+        # Keep characters that are not valid in Windows file names (or that would end
+        # the BULK INSERT path literal) out of the file name, and give tables whose
+        # names would share a data file (e.g. A/B and A_B, or Foo and FOO on a
+        # case-insensitive file system) a numbered file of their own
+        file_table_name = self._RE_FILE_NAME_UNSAFE.sub('_', table_name)
+        file_name = file_table_name
+        suffix = 1
+        while file_name.lower() in self._used_file_names:
+            suffix += 1
+            file_name = f"{file_table_name}_{suffix}"
+        self._used_file_names.add(file_name.lower())
+        data_file = f"{self.data_prefix}{file_name}.csv"
+        self.data_files[table_name] = (schema_name, data_file)
+        self.row_counts[table_name] = 0
+        return table_name, len(column_names)
+    
+    def _csv_row(self, row, column_count):
+        """Return the CSV line for a VALUES row, or None if a value is not a literal."""
+        values = [value.strip() for value in _RE_VALUE_FIELD.findall(row + ',')]
+        if len(values) != column_count:
+            return None
+        
+        fields = []
+        for value in values:
+            if value.upper() == 'NULL':
+                # An empty unquoted field is loaded as NULL (with KEEPNULLS)
+                fields.append('')
+            elif value.startswith("'"):
+                if not self._RE_STRING_LITERAL.fullmatch(value):
+                    return None
+                text = value[1:-1].replace("''", "'")
+                fields.append('"' + text.replace('"', '""') + '"')
+            elif self._RE_NUMBER_LITERAL.fullmatch(value):
+                fields.append(value)
+            else:
+                return None
+        return ','.join(fields) + '\n'
+    
+    def write(self, text):
+        """
+        Write a converted INSERT statement as a data row, or pass it to the fallback writer.
+        
+        Args:
+            text (str): Statement text, including its trailing newline
+        """
+        values_at = text.find(') VALUES (') + 8
+        row = text[values_at + 1:].rstrip()
+        if values_at < 8 or not text.startswith('INSERT INTO [') or not row.endswith(')'):
+            self.fallback_writer.write(text)
+            return
+        
+        insert_header = text[:values_at]
+        if insert_header in self._header_tables:
+            table = self._header_tables[insert_header]
+        else:
+            table = self._header_tables[insert_header] = self._table_for_header(insert_header)
+        
+        csv_row = table and self._csv_row(row[1:-1], table[1])
+        if not csv_row:
+            self.fallback_writer.write(text)
+            return
+        
+        table_name = table[0]
+        if table_name != self._current_table:
+            # Keep one data file open at a time; rows of a table usually arrive together
+            self.close()
+            mode = 'a' if self.row_counts[table_name] else 'w'
+            self._current_fh = open(self.data_files[table_name][1], mode, encoding='utf-8', newline='')
+            self._current_table = table_name
+        self._current_fh.write(csv_row)
+        self.row_counts[table_name] += 1
+    
+    def bulk_insert_statements(self):
+        """
+        Return the BULK INSERT statements that load the data files.
+        
+        Returns:
+            list: SQL lines with one BULK INSERT statement per table that has data rows
+        """
+        lines = []
+        for table_name, (schema_name, data_file) in self.data_files.items():
+            if not self.row_counts[table_name]:
+                continue
+            data_path = os.path.abspath(data_file).replace("'", "''")
+            lines.append(f"-- Bulk data: {table_name} ({self.row_counts[table_name]:,} rows)")
+            lines.append(f"BULK INSERT [{schema_name}].[{table_name}] FROM '{data_path}'")
+            lines.append("WITH (FORMAT = 'CSV', FIELDQUOTE = '\"', FIELDTERMINATOR = ',', ROWTERMINATOR = '0x0a',")
+            lines.append("      CODEPAGE = '65001', KEEPNULLS, TABLOCK);")
+            lines.append("GO")
+            lines.append("")
+        return lines
+    
+    def flush(self):
+        """Flush the current data file and the fallback writer."""
+        if self._current_fh is not None:
+            self._current_fh.flush()
+        self.fallback_writer.flush()
+    
+    def close(self):
+        """Close the current data file, if one is open."""
+        if self._current_fh is not None:
+            self._current_fh.close()
+            self._current_fh = None
+            self._current_table = None
+
+
+class PrefetchReader:
+    """
+    Iterates over the lines of a text file while a background thread reads ahead.
+    
+    The reader thread keeps up to queue_size blocks of the file queued, so the
+    disk reads for the next blocks overlap with the conversion of the lines
+    already read. Lines are split on newlines exactly as in text file iteration.
+    Call close() (or use the reader as a context manager) when stopping before
+    the end of the file, so that the reader thread does not stay blocked on a
+    full queue.
+    """
+    
+    def __init__(self, file_obj, block_size=1 << 20, queue_size=16):
+        """
+        Start reading ahead from an open text file.
+        
+        Args:
+            file_obj: Text file object to read from
+            block_size (int): Number of characters per read (default: 1 MiB)
+            queue_size (int): Maximum number of blocks read ahead
+        """
+        self.file_obj = file_obj
+        self.block_size = block_size
+        self._blocks = queue.Queue(maxsize=queue_size)
+        self._lines = iter(())
+        self._remainder = ''
+        self._done = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._read_blocks, daemon=True)
+        self._thread.start()
+    
+    def _put(self, item):
+        """Queue an item for the consumer; return False if the reader was closed while waiting."""
+        # Wait in short steps so that close() is noticed while the queue is full
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def _read_blocks(self):
+        """Read blocks until end of file or close(); an empty block marks the end."""
+        try:
+            while not self._stop.is_set():
+                block = self.file_obj.read(self.block_size)
+                if not self._put(block) or not block:
+                    break
+        except Exception as e:
+            self._put(e)
+    
+    def close(self):
+        """Stop reading ahead and wait for the reader thread to finish."""
+        self._stop.set()
+        self._done = True
+        self._lines = iter(())
+        self._thread.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        while True:
+            line = next(self._lines, None)
+            if line is not None:
+                return line
+            if self._done:
+                raise StopIteration
+            
+            block = self._blocks.get()
+            if isinstance(block, Exception):
+                raise block
+            if not block:
+                # End of file: return the last line if it has no trailing newline
+                self._done = True
+                line, self._remainder = self._remainder, ''
+                if line:
+                    return line
+                raise StopIteration
+            
+            parts = (self._remainder + block).split('\n')
+            self._remainder = parts.pop()
+            self._lines = iter([part + '\n' for part in parts])
+
 
 class OracleToSQLServerConverter:
     """
@@ -43,7 +455,85 @@ class OracleToSQLServerConverter:
     and comprehensive data fixes for common migration issues.
     """
     
-    def __init__(self, input_file, output_file=None, schema_name='ADMIN'):
+    # Precompiled regular expressions used on the per-line conversion path.
+    # Patterns that depend on the schema name are compiled in __init__.
+    
+    # Data type dispatch and sizes (convert_data_type)
+    _RE_TYPE_PREFIX = re.compile(
+        r'(?P<varchar2>VARCHAR2\()|(?P<varchar>VARCHAR\()|(?P<nvarchar2>NVARCHAR2\()'
+        r'|(?P<char>CHAR\()|(?P<nchar>NCHAR\()|(?P<raw>RAW\()'
+        r'|(?P<timestamp>TIMESTAMP\()|(?P<number>NUMBER\()'
+    )
+    _RE_VARCHAR2 = re.compile(r'VARCHAR2\((\d+)(?:\s+BYTE)?\)')
+    _RE_VARCHAR = re.compile(r'VARCHAR\((\d+)(?:\s+BYTE)?\)')
+    _RE_NVARCHAR2 = re.compile(r'NVARCHAR2\((\d+)(?:\s+BYTE)?\)')
+    _RE_CHAR = re.compile(r'CHAR\((\d+)(?:\s+BYTE)?\)')
+    _RE_NCHAR = re.compile(r'NCHAR\((\d+)(?:\s+BYTE)?\)')
+    _RE_RAW = re.compile(r'RAW\((\d+)\)')
+    _RE_NUMBER = re.compile(r'NUMBER\((\d+)(?:,(\d+))?\)')
+    
+    # Column definitions (convert_create_table)
+    _RE_QUOTED_COLUMN = re.compile(r'"([^"]+)"\s+(.+)')
+    _RE_UNQUOTED_COLUMN = re.compile(r'([A-Z_][A-Z0-9_]*)\s+(.+)')
+    
+    # Oracle storage clauses skipped inside CREATE TABLE (convert_create_table).
+    # Matched anywhere in the line, so NOLOGGING is skipped along with LOGGING.
+    _RE_STORAGE_CLAUSE = re.compile(
+        r'SEGMENT CREATION|PCTFREE|PCTUSED|INITRANS|MAXTRANS|NOCOMPRESS|LOGGING|STORAGE|'
+        r'TABLESPACE|BUFFER_POOL|FLASH_CACHE|CELL_FLASH_CACHE|PCTINCREASE|FREELISTS|FREELIST GROUPS',
+        re.IGNORECASE
+    )
+    
+    # Data type precision fixes (fix_data_type_precision), one alternative per fix:
+    # 1. DECIMAL(0,s) -> DECIMAL(1,s)
+    # 2. NVARCHAR(0), NCHAR(0), VARCHAR(0), CHAR(0) -> length 1
+    # 3. TIMESTAMP(n) -> DATETIME2
+    # 4. NUMBER without precision -> DECIMAL(18,0)
+    _RE_TYPE_PRECISION_FIX = re.compile(
+        r'DECIMAL\(0,(\d+)\)'
+        r'|(CHAR\(0\))'
+        r'|(TIMESTAMP\s*\(\s*\d+\s*\))'
+        r'|(\bNUMBER\b(?!\s*\())'
+    )
+    
+    # Oracle functions (convert_oracle_functions)
+    _RE_TO_TIMESTAMP = re.compile(r"to_timestamp\('([^']+)',([^)]+)\)")
+    _RE_TO_DATE = re.compile(r'to_date\(([^,]+),([^)]+)\)')
+    _RE_SYSDATE = re.compile(r'sys(?:date|timestamp)', re.IGNORECASE)  # sysdate and systimestamp
+    _MONTH_NUMBERS = {
+        'JAN': '01', 'FEB': '02', 'MAR': '03', 'APR': '04',
+        'MAY': '05', 'JUN': '06', 'JUL': '07', 'AUG': '08',
+        'SEP': '09', 'OCT': '10', 'NOV': '11', 'DEC': '12'
+    }
+    
+    # INSERT value handling (escape_quotes_in_values, fix_problematic_strings, fix_numeric_issues)
+    # DOTALL is required here so that multi-line VALUES clauses are matched
+    _RE_VALUES_CLAUSE = re.compile(r'VALUES\s*\((.*)\);?$', re.IGNORECASE | re.DOTALL)
+    _RE_QUOTED_STRING = re.compile(r"'([^']*(?:''[^']*)*)'")
+    _RE_BROWSER_VERSION = re.compile(r'\b(?:rv|version):(\d+\.\d+)')
+    _RE_REPEATED_CHARS = re.compile(r'(.)\1{10,}')  # 11+ repeated characters
+    _RE_SCIENTIFIC_STRING = re.compile(r"'(\d+E\d+)'")
+    
+    # Multi-line INSERT detection (read_complete_insert_statement): a complete or
+    # unterminated quoted section, or a single parenthesis
+    _RE_STATEMENT_TOKEN = re.compile(r"""'[^']*'?|"[^"]*"?|[()]""")
+    
+    # INSERT statement structure (convert_insert_statement)
+    _RE_INSERT_COLUMNS = re.compile(r'\(([^)]+)\)\s+values')
+    _RE_VALUES_START = re.compile(r'\)\s*\(')
+    _RE_NULL = re.compile(r'\bnull\b', re.IGNORECASE)
+    
+    # Oracle-only statements commented out by fix_malformed_statements
+    _RE_ORACLE_ONLY_STATEMENT = re.compile(r'\s*(?:USE |SET DEFINE|ALTER SESSION)', re.IGNORECASE)
+    
+    # Number of INSERT statements sent to a worker process at a time
+    INSERT_BATCH_SIZE = 10000
+    
+    # Maximum number of distinct INSERT column lists (and INSERT headers) kept converted
+    COLUMN_LIST_CACHE_SIZE = 4096
+    
+    def __init__(self, input_file, output_file=None, schema_name='ADMIN', io_backend='sync', workers=1,
+                 rows_per_insert=1, keep_all_file=False, emit_bulk=False):
         """
         Initialize the Oracle to SQL Server converter.
         
@@ -51,6 +541,16 @@ class OracleToSQLServerConverter:
             input_file (str): Path to the Oracle SQL export file
             output_file (str, optional): Custom output file path. If None, auto-generates based on input file
             schema_name (str): Target schema name for SQL Server (default: 'ADMIN')
+            io_backend (str): 'sync' to read the input file directly, or 'thread' to read ahead
+                in a background thread (default: 'sync')
+            workers (int): Number of worker processes converting INSERT statements; 1 converts
+                them in the main process (default: 1)
+            rows_per_insert (int): Maximum number of rows combined into one multi-row INSERT
+                statement; 1 writes one statement per row (default: 1)
+            keep_all_file (bool): Also write all INSERT statements to a single file
+                next to the chunk files (default: False)
+            emit_bulk (bool): Write INSERT rows to CSV data files per table, loaded by
+                BULK INSERT statements in the definitions file (default: False)
         """
         self.input_file = input_file
         if output_file is None:
@@ -60,7 +560,35 @@ class OracleToSQLServerConverter:
         else:
             self.output_file = output_file
         self.schema_name = schema_name
+        self.io_backend = io_backend
+        self.workers = workers
+        self.rows_per_insert = rows_per_insert
+        self.keep_all_file = keep_all_file
+        self.emit_bulk = emit_bulk
+        
+        # Schema-specific patterns, compiled once the schema name is known
+        schema = re.escape(schema_name)
+        self._re_create_table_quoted = re.compile(rf'CREATE TABLE\s+"{schema}"\."([^"]+)"')
+        self._re_create_table_unquoted = re.compile(rf'CREATE TABLE\s+{schema}\.([A-Z_][A-Z0-9_]*)')
+        self._re_insert_into = re.compile(rf'Insert into {schema}\.([^\s]+)\s*\(')
+        self._insert_into_replacement = rf'INSERT INTO [{schema_name}].[\1] ('
+        
+        # Data type conversion handlers, keyed by the _RE_TYPE_PREFIX group name
+        self._type_handlers = {
+            'varchar2': self._convert_varchar2,
+            'varchar': self._convert_varchar,
+            'nvarchar2': self._convert_nvarchar2,
+            'char': self._convert_char,
+            'nchar': self._convert_nchar,
+            'raw': self._convert_raw,
+            'timestamp': self._convert_timestamp,
+            'number': self._convert_number
+        }
+        
         self.table_info = {}
+        self._column_type_cache = {}
+        self._column_list_cache = {}
+        self._insert_header_cache = {}
         self.conversion_stats = {
             'tables_processed': 0,
             'inserts_processed': 0,
@@ -100,84 +628,95 @@ class OracleToSQLServerConverter:
         """
         oracle_type = oracle_type.upper().strip()
         
-        # Handle specific patterns
-        if oracle_type.startswith('VARCHAR2('):
-            size_match = re.search(r'VARCHAR2\((\d+)(?:\s+BYTE)?\)', oracle_type)
-            if size_match:
-                size = int(size_match.group(1))
-                # Oracle VARCHAR2 max is 4000, SQL Server NVARCHAR max is 4000
-                if size > 4000:
-                    return 'NVARCHAR(MAX)'
-                return f'NVARCHAR({size})'
-            return 'NVARCHAR(255)'
-        
-        elif oracle_type.startswith('VARCHAR('):
-            size_match = re.search(r'VARCHAR\((\d+)(?:\s+BYTE)?\)', oracle_type)
-            if size_match:
-                size = int(size_match.group(1))
-                return f'NVARCHAR({size})'
-            return 'NVARCHAR(255)'
-        
-        elif oracle_type.startswith('NVARCHAR2('):
-            size_match = re.search(r'NVARCHAR2\((\d+)(?:\s+BYTE)?\)', oracle_type)
-            if size_match:
-                size = int(size_match.group(1))
-                # Oracle NVARCHAR2 max is 2000, SQL Server NVARCHAR max is 4000
-                if size > 4000:
-                    return 'NVARCHAR(MAX)'
-                return f'NVARCHAR({size})'
-            return 'NVARCHAR(255)'
-        
-        elif oracle_type.startswith('CHAR('):
-            size_match = re.search(r'CHAR\((\d+)(?:\s+BYTE)?\)', oracle_type)
-            if size_match:
-                size = int(size_match.group(1))
-                return f'NCHAR({size})'
-            return 'NCHAR(1)'
-        
-        elif oracle_type.startswith('NCHAR('):
-            size_match = re.search(r'NCHAR\((\d+)(?:\s+BYTE)?\)', oracle_type)
-            if size_match:
-                size = int(size_match.group(1))
-                return f'NCHAR({size})'
-            return 'NCHAR(1)'
-        
-        elif oracle_type.startswith('RAW('):
-            # Convert RAW to VARBINARY (binary data, not text)
-            size_match = re.search(r'RAW\((\d+)\)', oracle_type)
-            if size_match:
-                size = int(size_match.group(1))
-                return f'VARBINARY({size})'
-            return 'VARBINARY(12)'
-        
-        elif oracle_type.startswith('TIMESTAMP('):
-            return 'DATETIME2'
-        
-        elif oracle_type.startswith('NUMBER('):
-            number_match = re.search(r'NUMBER\((\d+)(?:,(\d+))?\)', oracle_type)
-            if number_match:
-                precision = int(number_match.group(1))
-                scale = int(number_match.group(2)) if number_match.group(2) else 0
-                
-                if precision == 0:
-                    precision = 1
-                
-                if precision <= 1:
-                    return 'BIT'
-                elif precision <= 3:
-                    return 'TINYINT'
-                elif precision <= 5:
-                    return 'SMALLINT'
-                elif precision <= 10:
-                    return 'INT'
-                elif precision <= 19:
-                    return 'BIGINT'
-                else:
-                    return f'DECIMAL({precision},{scale})'
-            return 'DECIMAL(18,0)'
+        # Handle specific patterns, dispatching on the type name prefix
+        type_match = self._RE_TYPE_PREFIX.match(oracle_type)
+        if type_match:
+            return self._type_handlers[type_match.lastgroup](oracle_type)
         
         return self.data_type_mappings.get(oracle_type, oracle_type)
     
+    def _convert_varchar2(self, oracle_type: str) -> str:
+        """Convert an Oracle VARCHAR2(n) type."""
+        size_match = self._RE_VARCHAR2.search(oracle_type)
+        if size_match:
+            size = int(size_match.group(1))
+            # Oracle VARCHAR2 max is 4000, SQL Server NVARCHAR max is 4000
+            if size > 4000:
+                return 'NVARCHAR(MAX)'
+            return f'NVARCHAR({size})'
+        return 'NVARCHAR(255)'
+    
+    def _convert_varchar(self, oracle_type: str) -> str:
+        """Convert an Oracle VARCHAR(n) type."""
+        size_match = self._RE_VARCHAR.search(oracle_type)
+        if size_match:
+            size = int(size_match.group(1))
+            return f'NVARCHAR({size})'
+        return 'NVARCHAR(255)'
+    
+    def _convert_nvarchar2(self, oracle_type: str) -> str:
+        """Convert an Oracle NVARCHAR2(n) type."""
+        size_match = self._RE_NVARCHAR2.search(oracle_type)
+        if size_match:
+            size = int(size_match.group(1))
+            # Oracle NVARCHAR2 max is 2000, SQL Server NVARCHAR max is 4000
+            if size > 4000:
+                return 'NVARCHAR(MAX)'
+            return f'NVARCHAR({size})'
+        return 'NVARCHAR(255)'
+    
+    def _convert_char(self, oracle_type: str) -> str:
+        """Convert an Oracle CHAR(n) type."""
+        size_match = self._RE_CHAR.search(oracle_type)
+        if size_match:
+            size = int(size_match.group(1))
+            return f'NCHAR({size})'
+        return 'NCHAR(1)'
+    
+    def _convert_nchar(self, oracle_type: str) -> str:
+        """Convert an Oracle NCHAR(n) type."""
+        size_match = self._RE_NCHAR.search(oracle_type)
+        if size_match:
+            size = int(size_match.group(1))
+            return f'NCHAR({size})'
+        return 'NCHAR(1)'
+    
+    def _convert_raw(self, oracle_type: str) -> str:
+        """Convert an Oracle RAW(n) type to VARBINARY (binary data, not text)."""
+        size_match = self._RE_RAW.search(oracle_type)
+        if size_match:
+            size = int(size_match.group(1))
+            return f'VARBINARY({size})'
+        return 'VARBINARY(12)'
+    
+    def _convert_timestamp(self, oracle_type: str) -> str:
+        """Convert an Oracle TIMESTAMP(n) type."""
+        return 'DATETIME2'
+    
+    def _convert_number(self, oracle_type: str) -> str:
+        """Convert an Oracle NUMBER(p[,s]) type to the smallest fitting SQL Server type."""
+        number_match = self._RE_NUMBER.search(oracle_type)
+        if number_match:
+            precision = int(number_match.group(1))
+            scale = int(number_match.group(2)) if number_match.group(2) else 0
+            
+            if precision == 0:
+                precision = 1
+            
+            if precision <= 1:
+                return 'BIT'
+            elif precision <= 3:
+                return 'TINYINT'
+            elif precision <= 5:
+                return 'SMALLINT'
+            elif precision <= 10:
+                return 'INT'
+            elif precision <= 19:
+                return 'BIGINT'
+            else:
+                return f'DECIMAL({precision},{scale})'
+        return 'DECIMAL(18,0)'
+    
     def extract_table_name(self, create_table_line: str) -> str:
         """
         Extract table name from CREATE TABLE statement.
@@ -192,14 +731,12 @@ class OracleToSQLServerConverter:
             str: Extracted table name or 'UNKNOWN' if not found
         """
         # Handle quoted format: CREATE TABLE "SCHEMA"."TABLE_NAME"
-        quoted_pattern = rf'CREATE TABLE\s+"{self.schema_name}"\."([^"]+)"'
-        match = re.search(quoted_pattern, create_table_line)
+        match = self._re_create_table_quoted.search(create_table_line)
         if match:
             return match.group(1)
         
         # Handle unquoted format: CREATE TABLE SCHEMA.TABLE_NAME
-        unquoted_pattern = rf'CREATE TABLE\s+{self.schema_name}\.([A-Z_][A-Z0-9_]*)'
-        match = re.search(unquoted_pattern, create_table_line)
+        match = self._re_create_table_unquoted.search(create_table_line)
         if match:
             return match.group(1)
         
@@ -222,6 +759,7 @@ class OracleToSQLServerConverter:
         sql_server_lines = []
         table_name = None
         columns = []
+        column_names = []
         in_column_def = False
         
         for line in lines:
@@ -243,15 +781,11 @@ class OracleToSQLServerConverter:
                 continue
             
             # Skip Oracle-specific storage clauses
-            if any(keyword in line.upper() for keyword in [
-                'SEGMENT CREATION', 'PCTFREE', 'PCTUSED', 'INITRANS', 'MAXTRANS',
-                'NOCOMPRESS', 'LOGGING', 'STORAGE', 'TABLESPACE', 'BUFFER_POOL',
-                'FLASH_CACHE', 'CELL_FLASH_CACHE', 'PCTINCREASE', 'FREELISTS', 'FREELIST GROUPS'
-            ]):
+            if self._RE_STORAGE_CLAUSE.search(line):
                 continue
             
             # Handle simple table definitions that end with just ) or ); without storage clauses
-            if in_column_def and line.strip() == ')':
+            if in_column_def and line == ')':
                 in_column_def = False
                 continue
             
@@ -270,16 +804,16 @@ class OracleToSQLServerConverter:
                 
                 # Extract column name and definition more carefully
                 # Look for quoted column name followed by type definition
-                column_match = re.match(r'"([^"]+)"\s+(.+)', line_clean)
+                column_match = self._RE_QUOTED_COLUMN.match(line_clean)
                 if not column_match:
                     # Handle unquoted column names (new format)
-                    column_match = re.match(r'([A-Z_][A-Z0-9_]*)\s+(.+)', line_clean)
+                    column_match = self._RE_UNQUOTED_COLUMN.match(line_clean)
                 
                 if column_match:
                     column_name = column_match.group(1)
+                    column_names.append(column_name)
                     oracle_type = column_match.group(2).strip()
-                    sql_server_type = self.convert_data_type(oracle_type)
-                    sql_server_type = self.fix_data_type_precision(sql_server_type)
+                    sql_server_type = self.convert_column_type(oracle_type)
                     
                     if 'DEFAULT' in oracle_type.upper():
                         # Handle DEFAULT clauses more carefully, especially with function calls
@@ -289,8 +823,7 @@ class OracleToSQLServerConverter:
                             default_part = oracle_type[default_start + 7:].strip()  # 7 = len('DEFAULT')
                             # Remove DEFAULT from the type part
                             type_part = oracle_type[:default_start].strip()
-                            sql_server_type = self.convert_data_type(type_part)
-                            sql_server_type = self.fix_data_type_precision(sql_server_type)
+                            sql_server_type = self.convert_column_type(type_part)
                             
                             # Simplify complex Oracle DEFAULT clauses
                             if 'hextoraw(substr(sys_guid()' in default_part.lower():
@@ -322,25 +855,46 @@ class OracleToSQLServerConverter:
             
             self.table_info[table_name] = {
                 'columns': len(columns),
+                'column_names': column_names,
                 'column_definitions': columns
             }
             self.conversion_stats['tables_processed'] += 1
         
         return sql_server_lines
     
+    def convert_column_type(self, oracle_type: str) -> str:
+        """
+        Convert an Oracle column type to a SQL Server type with valid precision.
+        
+        Applies convert_data_type followed by fix_data_type_precision. A schema
+        has few distinct column types, so results are cached per type string.
+        
+        Args:
+            oracle_type (str): Oracle data type string from a column definition
+            
+        Returns:
+            str: SQL Server equivalent data type
+        """
+        sql_server_type = self._column_type_cache.get(oracle_type)
+        if sql_server_type is None:
+            sql_server_type = self.fix_data_type_precision(self.convert_data_type(oracle_type))
+            self._column_type_cache[oracle_type] = sql_server_type
+        return sql_server_type
+    
     def fix_data_type_precision(self, line: str) -> str:
         """Fix data type precision issues."""
-        line = re.sub(r'DECIMAL\(0,0\)', 'DECIMAL(1,0)', line)
-        line = re.sub(r'DECIMAL\(0,(\d+)\)', r'DECIMAL(1,\1)', line)
-        line = re.sub(r'DECIMAL\((\d+),0\)', r'DECIMAL(\1,0)', line)
-        line = re.sub(r'NVARCHAR\(0\)', 'NVARCHAR(1)', line)
-        line = re.sub(r'NCHAR\(0\)', 'NCHAR(1)', line)
-        line = re.sub(r'VARCHAR\(0\)', 'VARCHAR(1)', line)
-        line = re.sub(r'CHAR\(0\)', 'CHAR(1)', line)
-        line = re.sub(r'TIMESTAMP\s*\(\s*\d+\s*\)', 'DATETIME2', line)
-        line = re.sub(r'TIMESTAMP\s*\(\s*0\s*\)', 'DATETIME2', line)
-        line = re.sub(r'\bNUMBER\b(?!\s*\()', 'DECIMAL(18,0)', line)
-        return line
+        return self._RE_TYPE_PRECISION_FIX.sub(self._fix_type_precision_match, line)
+    
+    def _fix_type_precision_match(self, match) -> str:
+        """Return the replacement for one match of the data type precision fixes."""
+        fix = match.lastindex
+        if fix == 1:
+            return f'DECIMAL(1,{match.group(1)})'
+        elif fix == 2:
+            return 'CHAR(1)'
+        elif fix == 3:
+            return 'DATETIME2'
+        return 'DECIMAL(18,0)'
     
     def convert_oracle_functions(self, line: str) -> str:
         """
@@ -355,42 +909,54 @@ class OracleToSQLServerConverter:
         Returns:
             str: Line with Oracle functions converted to SQL Server equivalents
         """
-        def convert_to_timestamp(match):
-            date_str = match.group(1).strip().strip("'\"")
-            try:
-                date_part, time_part = date_str.split(' ')
-                day, month, year = date_part.split('-')
-                # Handle time part that may have microsecond precision
-                time_parts = time_part.split('.')
-                hour = time_parts[0]
-                minute = time_parts[1]
-                second = time_parts[2] if len(time_parts) > 2 else '00'
-                
-                year_int = int(year)
-                if year_int < 50:
-                    full_year = 2000 + year_int
-                else:
-                    full_year = 1900 + year_int
-                
-                month_map = {
-                    'JAN': '01', 'FEB': '02', 'MAR': '03', 'APR': '04',
-                    'MAY': '05', 'JUN': '06', 'JUL': '07', 'AUG': '08',
-                    'SEP': '09', 'OCT': '10', 'NOV': '11', 'DEC': '12'
-                }
-                month_num = month_map.get(month, '01')
-                
-                sql_server_date = f"'{full_year}-{month_num}-{day.zfill(2)} {hour.zfill(2)}:{minute.zfill(2)}:{second.zfill(2)}.000'"
-                return sql_server_date
-            except Exception as e:
-                # If conversion fails, return the original date string with quotes
-                return f"'{date_str}'"
-        
-        line = re.sub(r"to_timestamp\('([^']+)',([^)]+)\)", convert_to_timestamp, line)
-        line = re.sub(r'to_date\(([^,]+),([^)]+)\)', r'\1', line)
-        line = re.sub(r'sysdate', 'GETDATE()', line, flags=re.IGNORECASE)
-        line = re.sub(r'systimestamp', 'GETDATE()', line, flags=re.IGNORECASE)
+        line = self._RE_TO_TIMESTAMP.sub(self._convert_to_timestamp, line)
+        line = self._RE_TO_DATE.sub(self._keep_first_group, line)
+        line = self._RE_SYSDATE.sub('GETDATE()', line)
         return line
     
+    # Replacement callbacks for substitutions that run on every INSERT or string value.
+    # A replacement template with group references (e.g. r'\1') is prepared by Python
+    # code in the re module on every sub() call, even when nothing matches; a callback
+    # only costs a call for each actual match.
+    
+    def _keep_first_group(self, match) -> str:
+        """Return the first group of a match (r'\1')."""
+        return match.group(1)
+    
+    def _shorten_browser_version(self, match) -> str:
+        """Return a browser version without its rv:/version: prefix (r'version\1')."""
+        return 'version' + match.group(1)
+    
+    def _collapse_repeated_chars(self, match) -> str:
+        """Return a run of repeated characters cut down to three (r'\1\1\1... [REPEATED]')."""
+        return match.group(1) * 3 + '... [REPEATED]'
+    
+    def _convert_to_timestamp(self, match) -> str:
+        """Convert a matched Oracle to_timestamp() call to a SQL Server datetime literal."""
+        date_str = match.group(1).strip().strip("'\"")
+        try:
+            date_part, time_part = date_str.split(' ')
+            day, month, year = date_part.split('-')
+            # Handle time part that may have microsecond precision
+            time_parts = time_part.split('.')
+            hour = time_parts[0]
+            minute = time_parts[1]
+            second = time_parts[2] if len(time_parts) > 2 else '00'
+            
+            year_int = int(year)
+            if year_int < 50:
+                full_year = 2000 + year_int
+            else:
+                full_year = 1900 + year_int
+            
+            month_num = self._MONTH_NUMBERS.get(month, '01')
+            
+            sql_server_date = f"'{full_year}-{month_num}-{day.zfill(2)} {hour.zfill(2)}:{minute.zfill(2)}:{second.zfill(2)}.000'"
+            return sql_server_date
+        except Exception as e:
+            # If conversion fails, return the original date string with quotes
+            return f"'{date_str}'"
+    
     def escape_quotes_in_values(self, line: str) -> str:
         """
         Properly escape single quotes within string values in INSERT statements.
@@ -408,59 +974,26 @@ class OracleToSQLServerConverter:
         # This function handles the critical issue of unescaped single quotes
         # within string values that cause SQL Server syntax errors
         
-        # Pattern to match VALUES clause and extract the values part
-        # Use DOTALL flag to handle multi-line VALUES clauses
-        values_match = re.search(r'VALUES\s*\((.*)\);?$', line, re.IGNORECASE | re.DOTALL)
+        # Match the VALUES clause and extract the values part
+        # (the pattern uses DOTALL to handle multi-line VALUES clauses)
+        values_match = self._RE_VALUES_CLAUSE.search(line)
         if not values_match:
             return line
         
         values_part = values_match.group(1)
         original_values = values_match.group(0)
         
-        # Split by commas, but be careful about commas within quoted strings
-        values = []
-        current_value = ""
-        in_quotes = False
-        quote_char = None
-        
-        i = 0
-        while i < len(values_part):
-            char = values_part[i]
-            
-            if not in_quotes:
-                if char in ["'", '"']:
-                    in_quotes = True
-                    quote_char = char
-                    current_value += char
-                elif char == ',':
-                    values.append(current_value.strip())
-                    current_value = ""
-                else:
-                    current_value += char
-            else:
-                if char == quote_char:
-                    # Check if this is an escaped quote (double quote)
-                    if i + 1 < len(values_part) and values_part[i + 1] == quote_char:
-                        current_value += char + char  # Add both quotes
-                        i += 1  # Skip the next quote
-                    else:
-                        # End of quoted string
-                        in_quotes = False
-                        quote_char = None
-                        current_value += char
-                else:
-                    current_value += char
-            
-            i += 1
+        # Split by commas, but be careful about commas within quoted strings.
+        # A trailing comma is appended so that every value is comma-terminated.
+        values = [value.strip() for value in _RE_VALUE_FIELD.findall(values_part + ',')]
         
-        # Add the last value
-        if current_value.strip():
-            values.append(current_value.strip())
+        # Drop the last value if it is empty
+        if values and not values[-1]:
+            values.pop()
         
         # Process each value to escape unescaped single quotes
         processed_values = []
         for value in values:
-            value = value.strip()
             if value.startswith("'") and value.endswith("'"):
                 # This is a string value - escape internal single quotes
                 inner_content = value[1:-1]  # Remove outer quotes
@@ -502,13 +1035,12 @@ class OracleToSQLServerConverter:
                 return "'MALFORMED_STRING'"
             
             # Fix browser user agent strings
-            # Replace 'rv:version' with just 'version' (remove the colon)
-            string_content = re.sub(r'\brv:(\d+\.\d+)', r'version\1', string_content)
-            
-            # Replace 'version:version' with just 'version' (remove the colon)
-            string_content = re.sub(r'\bversion:(\d+\.\d+)', r'version\1', string_content)
+            # Replace 'rv:version' and 'version:version' with just 'version' (remove the colon)
+            if ':' in string_content:
+                string_content = self._RE_BROWSER_VERSION.sub(self._shorten_browser_version, string_content)
             
             # Replace other problematic patterns
+            # (chained str.replace calls are faster here than a single regex pass)
             string_content = string_content.replace('with', 'w/')
             string_content = string_content.replace('about', 'abt')
             
@@ -532,8 +1064,7 @@ class OracleToSQLServerConverter:
                 string_content = string_content[:truncate_at] + "... [TRUNCATED]"
             
             # Remove repeated characters (like 'InfinityInfinityInfinity...')
-            repeated_pattern = re.compile(r'(.)\1{10,}')  # 11+ repeated characters
-            string_content = repeated_pattern.sub(r'\1\1\1... [REPEATED]', string_content)
+            string_content = self._RE_REPEATED_CHARS.sub(self._collapse_repeated_chars, string_content)
             
             # Replace problematic characters
             string_content = string_content.replace('[', '(')
@@ -550,7 +1081,7 @@ class OracleToSQLServerConverter:
         # Use regex to find and replace content within single quotes
         # This handles both properly quoted strings and malformed strings
         original_line = line
-        line = re.sub(r"'([^']*(?:''[^']*)*)'", replace_in_strings, line)
+        line = self._RE_QUOTED_STRING.sub(replace_in_strings, line)
         
         # Debug: Check if the line was modified
         if original_line != line and 'cghmj.l' in original_line:
@@ -591,7 +1122,7 @@ class OracleToSQLServerConverter:
             str: Line with numeric issues fixed
         """
         # Fix scientific notation that's out of range
-        line = re.sub(r"'(\d+E\d+)'", r"NULL", line)  # Replace scientific notation with NULL
+        line = self._RE_SCIENTIFIC_STRING.sub(r"NULL", line)  # Replace scientific notation with NULL
         
         return line
     
@@ -613,10 +1144,9 @@ class OracleToSQLServerConverter:
             # Skip malformed lines
             return f"-- SKIPPED MALFORMED LINE: {line.strip()}"
         
-        # Remove Oracle-specific statements (only match at start of line or as standalone commands)
-        if (line.strip().upper().startswith('USE ') or 
-            line.strip().upper().startswith('SET DEFINE') or 
-            line.strip().upper().startswith('ALTER SESSION')):
+        # Remove Oracle-specific statements (only match at start of line or as standalone commands).
+        # An anchored case-insensitive match avoids copying the whole line with strip()/upper().
+        if self._RE_ORACLE_ONLY_STATEMENT.match(line):
             return f"-- {line.strip()} (Oracle specific, commented out)"
         
         return line
@@ -638,14 +1168,20 @@ class OracleToSQLServerConverter:
         # First handle malformed statements
         line = self.fix_malformed_statements(line)
         
-        # If line was commented out, return it as is
-        if line.strip().startswith('--'):
+        # If line was commented out, return it as is (lstrip returns the same
+        # string when there is no leading whitespace, so INSERTs are not copied)
+        if line.lstrip().startswith('--'):
             return line
         
         # Handle quote escaping - this is critical for SQL Server compatibility
         # Do this FIRST to ensure proper escaping before other processing
         line = self.escape_quotes_in_values(line)
         
+        # Without a single quote there are no string values for the string and
+        # scientific-notation fixes to act on, so only the parentheses fix applies
+        if "'" not in line:
+            return self.fix_extra_parentheses(line)
+        
         # Handle problematic strings that cause SQL Server syntax errors
         line = self.fix_problematic_strings(line)
         
@@ -670,23 +1206,62 @@ class OracleToSQLServerConverter:
         Returns:
             str: SQL Server compatible INSERT statement
         """
-        line = re.sub(rf'Insert into {self.schema_name}\.([^\s]+)\s*\(', rf'INSERT INTO [{self.schema_name}].[\1] (', line)
-        
-        def add_brackets_to_columns(match):
-            columns = match.group(1)
-            column_list = [col.strip() for col in columns.split(',')]
-            bracketed_columns = ', '.join([f'[{col}]' for col in column_list])
-            return f'({bracketed_columns})'
-        
-        line = re.sub(r'\(([^)]+)\)\s+values', add_brackets_to_columns, line)
-        line = re.sub(r'\)\s*\(', ') VALUES (', line)
+        line = self._convert_insert_header(line)
+        line = self._RE_VALUES_START.sub(') VALUES (', line)
         line = self.convert_oracle_functions(line)
-        line = re.sub(r'\bnull\b', 'NULL', line, flags=re.IGNORECASE)
+        # Only run the case-insensitive scan when the line can contain null
+        if 'null' in line.lower():
+            line = self._RE_NULL.sub('NULL', line)
         line = self.fix_data_type_issues(line)
         
         self.conversion_stats['inserts_processed'] += 1
         return line
     
+    def _convert_insert_header(self, line: str) -> str:
+        """
+        Convert the table name and column list of an INSERT statement.
+        
+        All INSERTs into a table share the same "Insert into ... (cols) values "
+        header, so its converted form is built once and spliced onto the rest
+        of each statement. The regexes still run over the whole line when the
+        values themselves contain text they would rewrite.
+        
+        Args:
+            line (str): Oracle INSERT statement
+            
+        Returns:
+            str: INSERT statement with bracketed table and column names
+        """
+        split_at = line.find(') values ') + 9
+        if split_at > 8 and line.find('values', split_at) < 0 and line.find('Insert into', split_at) < 0:
+            header = line[:split_at]
+            converted = self._insert_header_cache.get(header)
+            if converted is None:
+                converted = self._re_insert_into.sub(self._insert_into_replacement, header)
+                converted = self._RE_INSERT_COLUMNS.sub(self._add_brackets_to_columns, converted)
+                if len(self._insert_header_cache) < self.COLUMN_LIST_CACHE_SIZE:
+                    self._insert_header_cache[header] = converted
+            return converted + line[split_at:]
+        
+        line = self._re_insert_into.sub(self._insert_into_replacement, line)
+        return self._RE_INSERT_COLUMNS.sub(self._add_brackets_to_columns, line)
+    
+    def _add_brackets_to_columns(self, match) -> str:
+        """
+        Return the bracketed column list for a matched INSERT column list.
+        
+        Every INSERT into a table repeats the same column list, so the
+        bracketed form is built once per distinct column list and reused.
+        """
+        columns = match.group(1)
+        bracketed = self._column_list_cache.get(columns)
+        if bracketed is None:
+            bracketed = '([' + '], ['.join([col.strip() for col in columns.split(',')]) + '])'
+            # The pattern can also match inside string values, so bound the cache
+            if len(self._column_list_cache) < self.COLUMN_LIST_CACHE_SIZE:
+                self._column_list_cache[columns] = bracketed
+        return bracketed
+    
     def read_complete_insert_statement(self, infile, first_line: str, start_line_num: int) -> str:
         """
         Read a complete INSERT statement that may span multiple lines.
@@ -704,31 +1279,37 @@ class OracleToSQLServerConverter:
         """
         lines = [first_line]
         current_line = first_line
-        in_string = False
-        string_char = None
+        string_char = None  # Quote character of the open string, if any
         paren_count = 0
         
         while True:
-            # Process each character in the current line
-            for i, char in enumerate(current_line):
-                if not in_string:
-                    if char in ("'", '"'):
-                        in_string = True
-                        string_char = char
-                    elif char == '(':
+            # Test the usual ");\n" ending directly before stripping a copy of the line
+            ends_statement = current_line.endswith(');\n') or current_line.rstrip().endswith(');')
+            
+            # Close a string left open by the previous line
+            pos = 0
+            if string_char:
+                pos = current_line.find(string_char) + 1
+                if pos:
+                    string_char = None
+            
+            # Scan the quoted sections and parentheses in the rest of the line
+            if not string_char:
+                for token in self._RE_STATEMENT_TOKEN.finditer(current_line, pos):
+                    text = token.group()
+                    if text == '(':
                         paren_count += 1
-                    elif char == ')':
+                    elif text == ')':
                         paren_count -= 1
                         # If we've closed all parentheses and line ends with );, we're done
-                        if paren_count == 0 and current_line.strip().endswith(');'):
+                        if paren_count == 0 and ends_statement:
                             return ''.join(lines)
-                else:
-                    if char == string_char:
-                        in_string = False
-                        string_char = None
+                    elif len(text) == 1 or text[-1] != text[0]:
+                        # Unterminated string, continues on the next line
+                        string_char = text[0]
             
             # If we're still in a string, we need to continue reading
-            if in_string:
+            if string_char:
                 try:
                     next_line = next(infile)
                     self.conversion_stats['lines_processed'] += 1
@@ -740,7 +1321,7 @@ class OracleToSQLServerConverter:
                     break
             
             # If we're not in a string and line ends with );, we're done
-            if not in_string and current_line.strip().endswith(');'):
+            if ends_statement:
                 return ''.join(lines)
             
             # If we're not in a string and line doesn't end with );, continue reading
@@ -774,123 +1355,158 @@ class OracleToSQLServerConverter:
         converted_statement = self.convert_insert_statement(full_statement)
         return converted_statement
     
-    def split_inserts_into_chunks(self, inserts_file):
-        """
-        Split the INSERT statements file into 100,000 line chunks.
-        
-        Uses the Unix 'split' command to create manageable chunks
-        for SQL Server execution, naming them sequentially.
-        
-        Args:
-            inserts_file (str): Path to the large INSERT statements file
-        """
-        import subprocess
-        import os
-        
-        print("Splitting INSERT statements into 100,000 line chunks...")
-        
-        # Use split command to create chunks
-        chunk_prefix = inserts_file.replace('_all.sql', '_chunk_')
-        result = subprocess.run(['split', '-l', '100000', inserts_file, chunk_prefix], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            # Rename chunks to be more user-friendly
-            chunk_files = [f for f in os.listdir('.') if f.startswith(os.path.basename(chunk_prefix))]
-            chunk_files.sort()
-            
-            for i, chunk_file in enumerate(chunk_files, 1):
-                new_name = f"{chunk_prefix}{i:02d}.sql"
-                os.rename(chunk_file, new_name)
-            
-            print(f"Created {len(chunk_files)} INSERT chunk files")
-        else:
-            print(f"Warning: Failed to split INSERT statements: {result.stderr}")
-    
     def process_file(self):
         """
         Process the Oracle SQL file and convert to SQL Server format.
         
         Main conversion method that orchestrates the entire conversion process:
         reads the Oracle file, separates table definitions from INSERT statements,
-        converts both types, and splits large INSERT files into manageable chunks.
+        converts both types, and writes the INSERT statements in manageable chunks.
         """
         print(f"Converting {self.input_file} to SQL Server format")
         print(f"File size: {os.path.getsize(self.input_file) / (1024*1024):.1f} MB")
         
         # Create separate files for table definitions and INSERT statements
         definitions_file = self.output_file.replace('.sql', '_definitions.sql')
-        inserts_file = self.output_file.replace('.sql', '_inserts_all.sql')
-        
-        with open(self.input_file, 'r', encoding='utf-8', errors='ignore') as infile, \
-             open(definitions_file, 'w', encoding='utf-8') as def_outfile, \
-             open(inserts_file, 'w', encoding='utf-8') as inserts_outfile:
-            
-            # Write headers for both files
-            header = "-- Converted from Oracle to SQL Server\n"
-            header += f"-- Conversion date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            header += f"-- Original file: {self.input_file}\n"
-            header += "--\n"
-            header += "-- Note: This file has been automatically converted from Oracle format.\n"
-            header += "-- Please review and test before using in production.\n\n"
-            
-            def_outfile.write(header)
-            inserts_outfile.write(header)
-            
-            current_table_lines = []
-            current_insert_lines = []
-            in_create_table = False
-            in_insert_statement = False
-            
-            for line_num, line in enumerate(infile, 1):
-                self.conversion_stats['lines_processed'] = line_num
+        chunk_prefix = self.output_file.replace('.sql', '_inserts_chunk_')
+        inserts_file = self.output_file.replace('.sql', '_inserts_all.sql') if self.keep_all_file else None
+        bulk_prefix = self.output_file.replace('.sql', '_bulk_')
+        
+        # Header for the definitions file and every INSERT chunk file
+        header = "-- Converted from Oracle to SQL Server\n"
+        header += f"-- Conversion date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        header += f"-- Original file: {self.input_file}\n"
+        header += "--\n"
+        header += "-- Note: This file has been automatically converted from Oracle format.\n"
+        header += "-- Please review and test before using in production.\n\n"
+        
+        # Convert INSERT statements in worker processes if requested
+        pool = None
+        if self.workers > 1:
+            pool = multiprocessing.Pool(self.workers, initializer=_init_insert_worker,
+                                        initargs=(self.schema_name,))
+        insert_batch = []
+        pending_batches = deque()
+        bulk_writer = None
+        prefetch_reader = None
+        
+        try:
+            # Text-mode iteration splits and decodes lines in C, which measures faster than
+            # scanning an mmap of the file for newlines in Python and decoding each slice
+            with open(self.input_file, 'r', encoding='utf-8', errors='ignore') as infile, \
+                 open(definitions_file, 'w', encoding='utf-8') as def_outfile, \
+                 ChunkWriter(chunk_prefix, header, all_file=inserts_file) as inserts_outfile:
                 
-                if line_num % 10000 == 0:
-                    print(f"Processed {line_num:,} lines...")
+                def_outfile.write(header)
                 
-                original_line = line
-                line = line.strip()
+                # Tell the kernel the input is read sequentially
+                _advise_sequential(infile)
                 
-                # Skip comments and empty lines
-                if line.startswith('--') or line.startswith('REM') or not line:
-                    continue
+                # Overlap reading of the input file with the conversion work
+                if self.io_backend == 'thread':
+                    infile = prefetch_reader = PrefetchReader(infile)
                 
-                # Handle CREATE TABLE statements
-                if 'CREATE TABLE' in line:
-                    in_create_table = True
-                    current_table_lines = [line]
-                    continue
+                # Combine consecutive rows of a table into multi-row INSERT statements
+                inserts_writer = inserts_outfile
+                if self.rows_per_insert > 1:
+                    inserts_writer = MultiRowInsertWriter(inserts_outfile, self.rows_per_insert)
                 
-                if in_create_table:
-                    current_table_lines.append(line)
-                    # Handle both formats: ending with ; or ending with )
-                    if line.endswith(';') or (line.strip() == ')' and not any(keyword in line.upper() for keyword in [
-                        'SEGMENT CREATION', 'PCTFREE', 'PCTUSED', 'INITRANS', 'MAXTRANS',
-                        'NOCOMPRESS', 'LOGGING', 'STORAGE', 'TABLESPACE', 'BUFFER_POOL',
-                        'FLASH_CACHE', 'CELL_FLASH_CACHE', 'PCTINCREASE', 'FREELISTS', 'FREELIST GROUPS'
-                    ])):
-                        converted_lines = self.convert_create_table(current_table_lines)
-                        def_outfile.write('\n'.join(converted_lines) + '\n')
-                        in_create_table = False
-                        current_table_lines = []
-                    continue
+                # Write INSERT rows to CSV data files for BULK INSERT where possible
+                if self.emit_bulk:
+                    bulk_writer = inserts_writer = BulkDataWriter(bulk_prefix, inserts_writer, self.table_info)
                 
-                # Handle INSERT statements with proper string literal parsing
-                if line.startswith('Insert into'):
-                    # Use intelligent INSERT parsing that handles string literals across lines
-                    complete_insert = self.read_complete_insert_statement(infile, original_line, line_num)
-                    if complete_insert:
-                        converted_insert = self.convert_insert_statement(complete_insert)
-                        inserts_outfile.write(converted_insert + '\n')
-                    continue
+                current_table_lines = []
+                in_create_table = False
+                line_num = 0
+                # Compare against the next progress line number rather than taking
+                # a modulo of every line number
+                next_progress = 10000
                 
-                # Handle SET DEFINE OFF (Oracle specific)
-                if line.startswith('SET DEFINE OFF'):
-                    def_outfile.write('-- SET DEFINE OFF (Oracle specific, not needed in SQL Server)\n')
-                    continue
-        
-        # Split INSERT statements into chunks
-        self.split_inserts_into_chunks(inserts_file)
+                for line_num, line in enumerate(infile, 1):
+                    if line_num == next_progress:
+                        print(f"Processed {line_num:,} lines...")
+                        next_progress += 10000
+                    
+                    original_line = line
+                    line = line.strip()
+                    
+                    # Skip comments and empty lines
+                    if not line:
+                        continue
+                    
+                    # Most lines are INSERTs, so the prefix tests below first compare the
+                    # first character, which rules them out without a startswith call
+                    first_char = line[0]
+                    if (first_char == '-' and line.startswith('--')) or (first_char == 'R' and line.startswith('REM')):
+                        continue
+                    
+                    # Handle CREATE TABLE statements
+                    if 'CREATE TABLE' in line:
+                        in_create_table = True
+                        current_table_lines = [line]
+                        continue
+                    
+                    if in_create_table:
+                        current_table_lines.append(line)
+                        # Handle both formats: ending with ; or ending with )
+                        # (a line that is just ")" cannot hold a storage clause)
+                        if line.endswith(';') or line == ')':
+                            converted_lines = self.convert_create_table(current_table_lines)
+                            # A single write of the joined lines measures several times faster
+                            # than writelines() with a newline appended to each line
+                            def_outfile.write('\n'.join(converted_lines) + '\n')
+                            in_create_table = False
+                            current_table_lines = []
+                        continue
+                    
+                    # Handle INSERT statements with proper string literal parsing
+                    if first_char == 'I' and line.startswith('Insert into'):
+                        # Use intelligent INSERT parsing that handles string literals across lines
+                        complete_insert = self.read_complete_insert_statement(infile, original_line, line_num)
+                        if complete_insert:
+                            if pool is None:
+                                converted_insert = self.convert_insert_statement(complete_insert)
+                                inserts_writer.write(converted_insert + '\n')
+                            else:
+                                insert_batch.append(complete_insert)
+                                if len(insert_batch) == self.INSERT_BATCH_SIZE:
+                                    pending_batches.append(pool.apply_async(_convert_insert_batch, (insert_batch,)))
+                                    insert_batch = []
+                                    # Limit the number of batches held in memory, writing them in order
+                                    if len(pending_batches) > 2 * self.workers:
+                                        self._write_insert_batch(pending_batches.popleft().get(), inserts_writer)
+                        continue
+                    
+                    # Handle SET DEFINE OFF (Oracle specific)
+                    if first_char == 'S' and line.startswith('SET DEFINE OFF'):
+                        def_outfile.write('-- SET DEFINE OFF (Oracle specific, not needed in SQL Server)\n')
+                        continue
+                
+                # The continuation lines of multi-line INSERTs have already been counted
+                # by read_complete_insert_statement; add the lines read by the loop itself
+                self.conversion_stats['lines_processed'] += line_num
+                
+                # Write the INSERT statements still being converted by the worker processes
+                if pool is not None:
+                    if insert_batch:
+                        pending_batches.append(pool.apply_async(_convert_insert_batch, (insert_batch,)))
+                    while pending_batches:
+                        self._write_insert_batch(pending_batches.popleft().get(), inserts_writer)
+                
+                inserts_writer.flush()
+                
+                # Load the data files after all tables have been created
+                if bulk_writer is not None:
+                    def_outfile.write('\n'.join(bulk_writer.bulk_insert_statements()) + '\n')
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            if bulk_writer is not None:
+                bulk_writer.close()
+            # Release the read-ahead thread if the conversion stopped before the end of the input
+            if prefetch_reader is not None:
+                prefetch_reader.close()
         
         print(f"\nConversion completed!")
         print(f"Tables processed: {self.conversion_stats['tables_processed']}")
@@ -898,8 +1514,58 @@ class OracleToSQLServerConverter:
         print(f"Total lines processed: {self.conversion_stats['lines_processed']:,}")
         print(f"Output files:")
         print(f"  - Table definitions: {definitions_file}")
-        print(f"  - All INSERT statements: {inserts_file}")
-        print(f"  - INSERT chunks: {inserts_file.replace('_all.sql', '_chunk_*.sql')}")
+        if inserts_file is not None:
+            print(f"  - INSERT statements: {inserts_file}")
+        if bulk_writer is not None:
+            print(f"  - BULK INSERT data: {bulk_prefix}*.csv ({sum(1 for rows in bulk_writer.row_counts.values() if rows)} files, "
+                  f"{sum(bulk_writer.row_counts.values()):,} rows)")
+        print(f"  - INSERT chunks: {chunk_prefix}*.sql ({len(inserts_outfile.chunk_files)} files)")
+    
+    def _write_insert_batch(self, converted_inserts, inserts_outfile):
+        """
+        Write a batch of INSERT statements converted by a worker process.
+        
+        Args:
+            converted_inserts (list): Converted INSERT statements
+            inserts_outfile (ChunkWriter or MultiRowInsertWriter): Writer for the INSERT chunk files
+        """
+        for converted_insert in converted_inserts:
+            inserts_outfile.write(converted_insert + '\n')
+        self.conversion_stats['inserts_processed'] += len(converted_inserts)
+
+
+def _advise_sequential(file, offset=0, length=0):
+    """
+    Tell the kernel a file is read sequentially, so that it reads further ahead.
+    
+    The hint is not available on Windows, and pipes and some file systems reject
+    it; in both cases the file is simply read without it.
+    
+    Args:
+        file: Open file object
+        offset (int): Start of the range that will be read
+        length (int): Length of the range, or 0 for the rest of the file
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(file.fileno(), offset, length, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+# Converter used by each worker process when INSERT statements are converted in parallel
+_worker_converter = None
+
+
+def _init_insert_worker(schema_name):
+    """Create the converter used by an INSERT conversion worker process."""
+    global _worker_converter
+    _worker_converter = OracleToSQLServerConverter('', schema_name=schema_name)
+
+
+def _convert_insert_batch(statements):
+    """Convert a batch of INSERT statements in a worker process."""
+    return [_worker_converter.convert_insert_statement(statement) for statement in statements]
 
 
 def main():
@@ -921,7 +1587,7 @@ Examples:
 
 The converter will automatically:
 - Separate table definitions from INSERT statements
-- Split large INSERT files into 100,000 line chunks
+- Write INSERT statements in 100,000 line chunks
 - Convert Oracle data types to SQL Server equivalents
 - Handle Oracle-specific functions and syntax
         """
@@ -934,6 +1600,27 @@ The converter will automatically:
     parser.add_argument('--schema', 
                        default='ADMIN', 
                        help='Schema name to convert (default: ADMIN)')
+    parser.add_argument('--io-backend', 
+                       choices=['sync', 'thread'], 
+                       default='sync', 
+                       help='Input reading: sync, or thread to read ahead in the background (default: sync)')
+    parser.add_argument('--workers', 
+                       type=int, 
+                       default=1, 
+                       help='Number of worker processes converting INSERT statements (default: 1)')
+    parser.add_argument('--rows-per-insert', 
+                       type=int, 
+                       default=1, 
+                       help='Combine up to this many rows of a table into one multi-row INSERT '
+                            f'statement, at most {MultiRowInsertWriter.MAX_ROWS_PER_INSERT} (default: 1). '
+                            'SQL Server types each column from all rows together, so combined '
+                            'statements can fail or round differently than single-row ones')
+    parser.add_argument('--keep-all-file', 
+                       action='store_true', 
+                       help='Also write all INSERT statements to a single _inserts_all.sql file')
+    parser.add_argument('--emit-bulk', 
+                       action='store_true', 
+                       help='Write INSERT rows to CSV data files loaded by BULK INSERT statements in the definitions file')
     parser.add_argument('--version', 
                        action='version', 
                        version='Oracle to SQL Server Converter 2.0')
@@ -945,8 +1632,14 @@ The converter will automatically:
         print(f"Error: Input file '{args.input_file}' not found.")
         return 1
     
+    if not 1 <= args.rows_per_insert <= MultiRowInsertWriter.MAX_ROWS_PER_INSERT:
+        print(f"Error: --rows-per-insert must be between 1 and {MultiRowInsertWriter.MAX_ROWS_PER_INSERT}.")
+        return 1
+    
     try:
-        converter = OracleToSQLServerConverter(args.input_file, args.output, args.schema)
+        converter = OracleToSQLServerConverter(args.input_file, args.output, args.schema,
+                                               args.io_backend, args.workers, args.rows_per_insert,
+                                               args.keep_all_file, args.emit_bulk)
         converter.process_file()
         return 0
     except Exception as e: